@@ -1,38 +1,92 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import orjson
+import os
 import time
 import random
-from enum import Enum
-from dataclasses import dataclass, asdict
+from enum import IntEnum
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 import threading
 import queue
 import json
+from collections import deque
+from itertools import islice
+
+# JSON provider backed by orjson's C serializer (faster encode than the
+# stdlib json used by Flask's default provider)
+class ORJSONProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_DATACLASS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
+# Precomputed checksum table: checksum of a char is ord(char) ^ 0xFF
+_CHECKSUM = tuple(i ^ 0xFF for i in range(256))
+
+def _checksum_of(code: int) -> int:
+    """Checksum for any char code; the table only covers 0-255"""
+    return _CHECKSUM[code] if code < 256 else code ^ 0xFF
+
+# Ring-buffer size for packet/result history (overridable via env)
+_HISTORY_CAP = int(os.environ.get('HISTORY_CAP', 10000))
+
+# Dedicated RNG instance; skips the random-module singleton's per-call
+# attribute lookups
+_rng = random.Random()
+
 # Enums and Data Classes
-class State(Enum):
+class State(IntEnum):
     IDLE = 0
     SYN_RECEIVED = 1
     ACK_RECEIVED = 2
 
-@dataclass
+# State names indexed by state value, avoiding the Enum .name descriptor
+# lookup on every response
+_STATE_NAMES = ("IDLE", "SYN_RECEIVED", "ACK_RECEIVED")
+
+# Indices into the simulator's flat statistics counters; incrementing a
+# list slot skips the string hash + dict lookup of the old dict counters
+_TOTAL, _PASSED, _FAILED, _CKERR, _TRANS = range(5)
+_STAT_NAMES = ('total_packets', 'passed_packets', 'failed_packets',
+               'checksum_errors', 'state_transitions')
+
+# FSM transition table: (state, input char code) -> (next_state, output,
+# response_type). Anything not in the table echoes the input back ("echo"
+# before the handshake completes, "data_transfer" after).
+_FSM = {
+    (State.IDLE, ord("S")): (State.SYN_RECEIVED, "A", "syn_ack"),
+    (State.SYN_RECEIVED, ord("K")): (State.ACK_RECEIVED, "C", "ack_complete"),
+}
+
+@dataclass(slots=True)
 class Packet:
     data: str
     checksum: int
     flags: int
     timestamp: float
     is_valid: bool = True
-    
+    data_code: int = 0
+
+    def __post_init__(self):
+        # Cache the char code once; the FSM, checksum and coverage paths
+        # all key by int instead of re-decoding the 1-char string
+        self.data_code = ord(self.data)
+
     def compute_checksum(self):
-        return ord(self.data) ^ 0xFF
-    
+        return _checksum_of(self.data_code)
+
     def verify_checksum(self):
         return self.checksum == self.compute_checksum()
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResult:
     input_packet: Packet
     output_data: str
@@ -42,73 +96,166 @@ class SimulationResult:
     response_type: str
     timestamp: float
 
+# Coverage tracking, input buckets keyed by char code
+_INPUT_BUCKETS = {ord('S'): 'syn', ord('K'): 'ack', ord('Z'): 'noise'}
+
+class CoverageTracker:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.input_coverage = {
+            'syn': 0,
+            'ack': 0,
+            'noise': 0,
+            'misc': 0
+        }
+        self.fsm_transitions = {
+            'idle_to_syn': 0,
+            'syn_to_ack': 0,
+            'resets': 0
+        }
+        self._report = None  # cached report, invalidated on update
+
+    def record_packet(self, data_code: int, response_type: str):
+        """Fused per-packet update: input bucket plus any transition fired.
+
+        Called from the FSM step, which already knows the input char code
+        and which transition (if any) fired, so nothing is re-inspected.
+        """
+        self.input_coverage[_INPUT_BUCKETS.get(data_code, 'misc')] += 1
+        if response_type == "syn_ack":
+            self.fsm_transitions['idle_to_syn'] += 1
+        elif response_type == "ack_complete":
+            self.fsm_transitions['syn_to_ack'] += 1
+        self._report = None
+
+    def get_coverage_report(self):
+        # Percentage of categories/transitions exercised at least once;
+        # rebuild only when a counter changed since the last report
+        if self._report is None:
+            covered_inputs = sum(1 for v in self.input_coverage.values() if v)
+            covered_transitions = sum(1 for v in self.fsm_transitions.values() if v)
+
+            self._report = {
+                'input_coverage': self.input_coverage,
+                'fsm_transitions': self.fsm_transitions,
+                'input_coverage_percentage': (covered_inputs / len(self.input_coverage)) * 100,
+                'fsm_coverage_percentage': (covered_transitions / len(self.fsm_transitions)) * 100
+            }
+        return self._report
+
+# Batch FSM core. Operates on parallel arrays of small ints only, so it
+# stays a tight loop with no attribute/dict access and can be compiled by
+# numba when that is installed (pure-Python otherwise).
+def _simulate_batch(codes, checksums, start_state):
+    """Run the FSM over parallel arrays of char codes and checksums.
+
+    Returns (out_codes, states_before, states_after, valid, end_state);
+    out_codes holds the response char code for each input packet.
+    """
+    n = len(codes)
+    out_codes = [0] * n
+    states_before = [0] * n
+    states_after = [0] * n
+    valid = [False] * n
+    state = start_state
+
+    for i in range(n):
+        code = codes[i]
+        states_before[i] = state
+        ok = checksums[i] == code ^ 0xFF
+        valid[i] = ok
+        if not ok:
+            out_codes[i] = 69  # 'E'
+        elif state == 0 and code == 83:  # IDLE + 'S'
+            state = 1
+            out_codes[i] = 65  # 'A'
+        elif state == 1 and code == 75:  # SYN_RECEIVED + 'K'
+            state = 2
+            out_codes[i] = 67  # 'C'
+        else:
+            out_codes[i] = code
+        states_after[i] = state
+
+    return out_codes, states_before, states_after, valid, state
+
+try:
+    from numba import njit
+    _simulate_batch = njit(cache=True)(_simulate_batch)
+except ImportError:
+    pass
+
 # TCP/IP Stack Simulator
 class TCPIPStackSimulator:
-    def __init__(self):
+    def __init__(self, coverage: CoverageTracker):
         self.state = State.IDLE
+        self.coverage = coverage
+        # Guards the state/statistics/history mutation in process_packet;
+        # WSGI servers call the endpoints from multiple threads
+        self._lock = threading.Lock()
         self.reset()
         
     def reset(self):
-        self.state = State.IDLE
-        self.packet_history = []
-        self.simulation_results = []
-        self.statistics = {
-            'total_packets': 0,
-            'passed_packets': 0,
-            'failed_packets': 0,
-            'checksum_errors': 0,
-            'state_transitions': 0
-        }
-        
+        # Taken under the lock so a reset can't interleave with a batch
+        # that is mid-flight in the worker thread
+        with self._lock:
+            self.state = State.IDLE
+            self.packet_history = deque(maxlen=_HISTORY_CAP)
+            self.simulation_results = deque(maxlen=_HISTORY_CAP)
+            self._stats = [0, 0, 0, 0, 0]
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """Statistics counters as a dict, built only when serialized"""
+        return dict(zip(_STAT_NAMES, self._stats))
+
+
     def process_packet(self, packet: Packet) -> Dict[str, Any]:
         """Process a single packet through the TCP/IP stack"""
-        self.statistics['total_packets'] += 1
-        
+        with self._lock:
+            return self._process_packet_locked(packet)
+
+    def _process_packet_locked(self, packet: Packet) -> Dict[str, Any]:
+        """FSM step body; caller must hold self._lock"""
+        self._stats[_TOTAL] += 1
+
         state_before = self.state
         output_data = ""
         response_type = "normal"
         
-        # Verify checksum first
-        if not packet.verify_checksum():
+        # Verify checksum once and reuse the result below
+        checksum_valid = packet.verify_checksum()
+        if not checksum_valid:
             output_data = "E"
             response_type = "error"
-            self.statistics['checksum_errors'] += 1
-            self.statistics['failed_packets'] += 1
+            self._stats[_CKERR] += 1
+            self._stats[_FAILED] += 1
         else:
-            # Process based on current state and input
-            if self.state == State.IDLE:
-                if packet.data == "S":
-                    self.state = State.SYN_RECEIVED
-                    output_data = "A"
-                    response_type = "syn_ack"
-                    self.statistics['state_transitions'] += 1
-                else:
-                    output_data = packet.data
-                    response_type = "echo"
-                    
-            elif self.state == State.SYN_RECEIVED:
-                if packet.data == "K":
-                    self.state = State.ACK_RECEIVED
-                    output_data = "C"
-                    response_type = "ack_complete"
-                    self.statistics['state_transitions'] += 1
-                else:
-                    output_data = packet.data
-                    response_type = "echo"
-                    
-            elif self.state == State.ACK_RECEIVED:
+            # Process based on current state and input: one table lookup
+            # instead of the old if/elif ladder
+            st = self.state
+            transition = _FSM.get((st, packet.data_code))
+            if transition is not None:
+                self.state, output_data, response_type = transition
+                self._stats[_TRANS] += 1
+            else:
                 output_data = packet.data
-                response_type = "data_transfer"
-                
-            self.statistics['passed_packets'] += 1
-        
+                response_type = "data_transfer" if st == State.ACK_RECEIVED else "echo"
+
+            self._stats[_PASSED] += 1
+
+        # Coverage is fused into the FSM step: input char and fired
+        # transition are already known here
+        self.coverage.record_packet(packet.data_code, response_type)
+
         # Create simulation result
         result = SimulationResult(
             input_packet=packet,
             output_data=output_data,
             state_before=state_before,
             state_after=self.state,
-            checksum_valid=packet.verify_checksum(),
+            checksum_valid=checksum_valid,
             response_type=response_type,
             timestamp=time.time()
         )
@@ -119,101 +266,181 @@ class TCPIPStackSimulator:
         return {
             'input_data': packet.data,
             'output_data': output_data,
-            'state_before': state_before.name,
-            'state_after': self.state.name,
-            'checksum_valid': packet.verify_checksum(),
+            'state_before': _STATE_NAMES[state_before],
+            'state_after': _STATE_NAMES[self.state],
+            'checksum_valid': checksum_valid,
             'response_type': response_type,
             'timestamp': result.timestamp
         }
 
-# Global simulator instance
-simulator = TCPIPStackSimulator()
+    def process_batch(self, packets: List[Packet]) -> List[Dict[str, Any]]:
+        """Process a batch of packets through the FSM core in one pass"""
+        codes = [p.data_code for p in packets]
+        checksums = [p.checksum for p in packets]
+        responses = []
 
-# Coverage tracking
-class CoverageTracker:
-    def __init__(self):
-        self.input_coverage = {
-            'syn': 0,
-            'ack': 0,
-            'noise': 0,
-            'misc': 0
-        }
-        self.fsm_transitions = {
-            'idle_to_syn': 0,
-            'syn_to_ack': 0,
-            'resets': 0
-        }
-        
-    def update_input_coverage(self, data: str):
-        if data == "S":
-            self.input_coverage['syn'] += 1
-        elif data == "K":
-            self.input_coverage['ack'] += 1
-        elif data == "Z":
-            self.input_coverage['noise'] += 1
-        else:
-            self.input_coverage['misc'] += 1
-            
-    def update_fsm_coverage(self, state_before: State, state_after: State):
-        if state_before == State.IDLE and state_after == State.SYN_RECEIVED:
-            self.fsm_transitions['idle_to_syn'] += 1
-        elif state_before == State.SYN_RECEIVED and state_after == State.ACK_RECEIVED:
-            self.fsm_transitions['syn_to_ack'] += 1
-            
-    def get_coverage_report(self):
-        total_inputs = sum(self.input_coverage.values())
-        total_transitions = sum(self.fsm_transitions.values())
-        
-        return {
-            'input_coverage': self.input_coverage,
-            'fsm_transitions': self.fsm_transitions,
-            'input_coverage_percentage': (total_inputs / max(1, total_inputs)) * 100,
-            'fsm_coverage_percentage': (total_transitions / max(1, total_transitions)) * 100
-        }
+        with self._lock:
+            out_codes, states_before, states_after, valid, end_state = \
+                _simulate_batch(codes, checksums, int(self.state))
+            self.state = State(end_state)
+
+            stats = self._stats
+            for i, packet in enumerate(packets):
+                checksum_valid = valid[i]
+                sb = states_before[i]
+                sa = states_after[i]
+                output_data = chr(out_codes[i])
+
+                stats[_TOTAL] += 1
+                if not checksum_valid:
+                    response_type = "error"
+                    stats[_CKERR] += 1
+                    stats[_FAILED] += 1
+                else:
+                    if sa != sb:
+                        response_type = "syn_ack" if sa == State.SYN_RECEIVED else "ack_complete"
+                        stats[_TRANS] += 1
+                    else:
+                        response_type = "data_transfer" if sb == State.ACK_RECEIVED else "echo"
+                    stats[_PASSED] += 1
+
+                self.coverage.record_packet(packet.data_code, response_type)
+
+                result = SimulationResult(
+                    input_packet=packet,
+                    output_data=output_data,
+                    state_before=State(sb),
+                    state_after=State(sa),
+                    checksum_valid=checksum_valid,
+                    response_type=response_type,
+                    timestamp=packet.timestamp
+                )
+
+                self.simulation_results.append(result)
+                self.packet_history.append(packet)
 
+                responses.append({
+                    'input_data': packet.data,
+                    'output_data': output_data,
+                    'state_before': _STATE_NAMES[sb],
+                    'state_after': _STATE_NAMES[sa],
+                    'checksum_valid': checksum_valid,
+                    'response_type': response_type,
+                    'timestamp': result.timestamp
+                })
+
+        return responses
+
+# Global coverage tracker and simulator instances
 coverage_tracker = CoverageTracker()
+simulator = TCPIPStackSimulator(coverage_tracker)
+
+# Micro-batching for /api/send-packet: concurrent sends queue up and one
+# worker thread drains them in batches, paying the simulator lock and FSM
+# dispatch once per batch instead of once per request (costs up to one
+# tick of added latency)
+_BATCH_MAX = 32
+_BATCH_TICK = 0.001  # seconds the worker lingers collecting a batch
+
+class _PacketBatcher:
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, packet: Packet) -> Dict[str, Any]:
+        """Enqueue a packet and block until its batch has been processed.
+
+        Re-raises in the caller's thread if the batch failed.
+        """
+        done = threading.Event()
+        job = [packet, done, None, None]  # packet, event, result, error
+        self._queue.put(job)
+        done.wait()
+        if job[3] is not None:
+            raise job[3]
+        return job[2]
+
+    def _run(self):
+        while True:
+            jobs = [self._queue.get()]
+            # Linger briefly so concurrent requests can join this batch
+            time.sleep(_BATCH_TICK)
+            while len(jobs) < _BATCH_MAX:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # A failed batch must not kill the worker or leave callers
+            # blocked: hand the exception to every pending job instead
+            try:
+                responses = simulator.process_batch([job[0] for job in jobs])
+            except Exception as e:
+                for job in jobs:
+                    job[3] = e
+                    job[1].set()
+                continue
+
+            for job, response in zip(jobs, responses):
+                job[2] = response
+                job[1].set()
+
+packet_batcher = _PacketBatcher()
 
 # API Endpoints
 @app.route('/api/reset', methods=['POST'])
 def reset_simulation():
     """Reset the simulation state"""
-    global simulator, coverage_tracker
     simulator.reset()
-    coverage_tracker = CoverageTracker()
+    coverage_tracker.reset()
     return jsonify({
         'message': 'Simulation reset successfully',
-        'state': simulator.state.name,
+        'state': _STATE_NAMES[simulator.state],
         'timestamp': time.time()
     })
 
+@dataclass(slots=True)
+class SendPacketResponse:
+    """Fixed-shape success response for /api/send-packet.
+
+    orjson serializes the dataclass directly, so the hot endpoint skips
+    building a fresh response dict per request.
+    """
+    success: bool
+    result: Dict[str, Any]
+    statistics: Dict[str, int]
+
 @app.route('/api/send-packet', methods=['POST'])
 def send_packet():
     """Send a single packet to the TCP/IP stack"""
     try:
         data = request.json
         
-        # Create packet
+        # Create packet; only compute the default checksum when the client
+        # didn't supply one
+        checksum = data.get('checksum')
+        if checksum is None:
+            checksum = _checksum_of(ord(data['data']))
+
         packet = Packet(
             data=data['data'],
-            checksum=data.get('checksum', ord(data['data']) ^ 0xFF),
+            checksum=checksum,
             flags=data.get('flags', 0),
             timestamp=time.time()
         )
         
-        # Process packet
-        state_before = simulator.state
-        result = simulator.process_packet(packet)
-        
-        # Update coverage
-        coverage_tracker.update_input_coverage(packet.data)
-        coverage_tracker.update_fsm_coverage(state_before, simulator.state)
-        
-        return jsonify({
-            'success': True,
-            'result': result,
-            'statistics': simulator.statistics
-        })
-        
+        # Process packet (batched with any concurrent sends; the worker
+        # also records coverage)
+        result = packet_batcher.submit(packet)
+
+
+        return jsonify(SendPacketResponse(
+            success=True,
+            result=result,
+            statistics=simulator.statistics
+        ))
+
     except Exception as e:
         return jsonify({
             'success': False,
@@ -228,28 +455,27 @@ def perform_handshake():
         simulator.reset()
         
         results = []
-        
+
+        # Both packets are synthesized by this request, so one timestamp
+        # covers them
+        now = time.time()
+
         # Step 1: Send SYN
-        syn_packet = Packet(data="S", checksum=ord("S") ^ 0xFF, flags=1, timestamp=time.time())
+        syn_packet = Packet(data="S", checksum=_CHECKSUM[ord("S")], flags=1, timestamp=now)
         syn_result = simulator.process_packet(syn_packet)
         results.append(syn_result)
-        
+
         # Step 2: Send ACK
-        ack_packet = Packet(data="K", checksum=ord("K") ^ 0xFF, flags=2, timestamp=time.time())
+        ack_packet = Packet(data="K", checksum=_CHECKSUM[ord("K")], flags=2, timestamp=now)
         ack_result = simulator.process_packet(ack_packet)
         results.append(ack_result)
-        
-        # Update coverage
-        coverage_tracker.update_input_coverage("S")
-        coverage_tracker.update_input_coverage("K")
-        coverage_tracker.update_fsm_coverage(State.IDLE, State.SYN_RECEIVED)
-        coverage_tracker.update_fsm_coverage(State.SYN_RECEIVED, State.ACK_RECEIVED)
-        
+
+
         return jsonify({
             'success': True,
             'handshake_complete': simulator.state == State.ACK_RECEIVED,
             'results': results,
-            'final_state': simulator.state.name,
+            'final_state': _STATE_NAMES[simulator.state],
             'statistics': simulator.statistics
         })
         
@@ -271,43 +497,41 @@ def run_test():
         simulator.reset()
         
         results = []
-        
+
+        # One timestamp covers every packet synthesized by this request
+        now = time.time()
+
         # Perform handshake first
         for packet_data in ["S", "K"]:
             packet = Packet(
                 data=packet_data,
-                checksum=ord(packet_data) ^ 0xFF,
+                checksum=_CHECKSUM[ord(packet_data)],
                 flags=1 if packet_data == "S" else 2,
-                timestamp=time.time()
+                timestamp=now
             )
             result = simulator.process_packet(packet)
             results.append(result)
         
         # Send random packets
         test_chars = ["X", "Y", "Z", "A", "B", "C"]
-        
-        for i in range(num_packets):
-            # Random data
-            data_char = random.choice(test_chars)
-            
-            # Introduce checksum errors 20% of the time if enabled
-            if include_errors and random.random() < 0.2:
-                checksum = ord(data_char) ^ 0xAA  # Wrong checksum
-            else:
-                checksum = ord(data_char) ^ 0xFF  # Correct checksum
-            
-            packet = Packet(
-                data=data_char,
-                checksum=checksum,
-                flags=random.randint(0, 3),
-                timestamp=time.time()
-            )
-            
-            result = simulator.process_packet(packet)
-            results.append(result)
-            
-            # Update coverage
-            coverage_tracker.update_input_coverage(data_char)
+
+        # Generate the whole batch up front (bulk RNG calls) so the loop
+        # below only does the FSM step
+        chars = _rng.choices(test_chars, k=num_packets)
+        if include_errors:
+            # Introduce checksum errors ~20% of the time (byte < 51 is a
+            # 51/256 draw)
+            checksums = [ord(c) ^ 0xAA if b < 51 else _CHECKSUM[ord(c)]
+                         for c, b in zip(chars, os.urandom(num_packets))]
+        else:
+            checksums = [_CHECKSUM[ord(c)] for c in chars]
+        flags = [b & 3 for b in os.urandom(num_packets)]
+
+        packets = [
+            Packet(data=data_char, checksum=checksum, flags=flag, timestamp=now)
+            for data_char, checksum, flag in zip(chars, checksums, flags)
+        ]
+        results.extend(simulator.process_batch(packets))
         
         # Generate coverage report
         coverage_report = coverage_tracker.get_coverage_report()
@@ -317,7 +541,7 @@ def run_test():
             'results': results,
             'statistics': simulator.statistics,
             'coverage': coverage_report,
-            'final_state': simulator.state.name
+            'final_state': _STATE_NAMES[simulator.state]
         })
         
     except Exception as e:
@@ -329,21 +553,78 @@ def run_test():
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """Get current simulation status"""
+    # Snapshot mutable simulator state under the lock; serialize outside it
+    with simulator._lock:
+        current_state = simulator.state
+        statistics = simulator.statistics  # property builds a fresh dict
+        packet_count = len(simulator.packet_history)
+
     return jsonify({
-        'current_state': simulator.state.name,
-        'statistics': simulator.statistics,
-        'packet_count': len(simulator.packet_history),
+        'current_state': _STATE_NAMES[current_state],
+        'statistics': statistics,
+        'packet_count': packet_count,
         'coverage': coverage_tracker.get_coverage_report()
     })
 
+def _packet_json(p: Packet) -> str:
+    """Serialize a single Packet record to a JSON string"""
+    # orjson serializes the dataclass in one pass, no intermediate dict
+    return orjson.dumps(p, option=orjson.OPT_SERIALIZE_DATACLASS).decode()
+
+def _result_json(r: SimulationResult) -> str:
+    """Serialize a single SimulationResult record to a JSON string"""
+    # Shallow wrapper only: the nested Packet serializes natively, and the
+    # State fields are spelled out by name (orjson would emit IntEnums as
+    # raw ints)
+    return orjson.dumps({
+        'input_packet': r.input_packet,
+        'output_data': r.output_data,
+        'state_before': _STATE_NAMES[r.state_before],
+        'state_after': _STATE_NAMES[r.state_after],
+        'checksum_valid': r.checksum_valid,
+        'response_type': r.response_type,
+        'timestamp': r.timestamp
+    }, option=orjson.OPT_SERIALIZE_DATACLASS).decode()
+
 @app.route('/api/history', methods=['GET'])
 def get_history():
     """Get simulation history"""
-    return jsonify({
-        'packet_history': [asdict(p) for p in simulator.packet_history],
-        'simulation_results': [asdict(r) for r in simulator.simulation_results],
-        'statistics': simulator.statistics
-    })
+    # Optional ?limit=N returns only the most recent N records
+    limit = request.args.get('limit', type=int)
+
+    # Snapshot the records under the lock: the generator runs after this
+    # view returns, and iterating the live deques would raise if a
+    # concurrent packet appended mid-stream
+    with simulator._lock:
+        packets = simulator.packet_history
+        results = simulator.simulation_results
+        if limit is not None and limit >= 0:
+            packets = list(islice(packets, max(0, len(packets) - limit), None))
+            results = list(islice(results, max(0, len(results) - limit), None))
+        else:
+            packets = list(packets)
+            results = list(results)
+        statistics = simulator.statistics
+
+    # Stream one record at a time instead of materializing asdict() copies
+    # of the whole history before serialization
+    def generate():
+        yield '{"packet_history":['
+        for i, p in enumerate(packets):
+            yield (',' if i else '') + _packet_json(p)
+        yield '],"simulation_results":['
+        for i, r in enumerate(results):
+            yield (',' if i else '') + _result_json(r)
+        yield '],"statistics":' + orjson.dumps(statistics).decode() + '}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+@lru_cache(maxsize=4096)
+def _validate(char: str, provided_checksum: Optional[int]):
+    """Pure checksum validation, memoized on (char, provided_checksum)"""
+    correct_checksum = _checksum_of(ord(char))
+    is_valid = provided_checksum == correct_checksum if provided_checksum is not None else True
+    return correct_checksum, is_valid
 
 @app.route('/api/validate-checksum', methods=['POST'])
 def validate_checksum():
@@ -352,10 +633,15 @@ def validate_checksum():
         data = request.json
         char = data['data']
         provided_checksum = data.get('checksum')
-        
-        correct_checksum = ord(char) ^ 0xFF
-        is_valid = provided_checksum == correct_checksum if provided_checksum is not None else True
-        
+
+        try:
+            correct_checksum, is_valid = _validate(char, provided_checksum)
+        except TypeError:
+            # Unhashable checksum (e.g. a list) can't be memoized; compare
+            # directly like the pre-cache path did
+            correct_checksum = _checksum_of(ord(char))
+            is_valid = provided_checksum == correct_checksum
+
         return jsonify({
             'data': char,
             'correct_checksum': correct_checksum,
@@ -369,6 +655,14 @@ def validate_checksum():
             'error': str(e)
         }), 400
 
+@lru_cache(maxsize=16)
+def _fixed_packet(packet_type: str, introduce_error: bool):
+    """Memoized (char, checksum, flags) for the deterministic packet types"""
+    char = 'S' if packet_type == 'syn' else 'K'
+    flags = 1 if packet_type == 'syn' else 2
+    checksum = ord(char) ^ 0xAA if introduce_error else _CHECKSUM[ord(char)]
+    return char, checksum, flags
+
 @app.route('/api/generate-packet', methods=['POST'])
 def generate_packet():
     """Generate a random packet for testing"""
@@ -376,26 +670,26 @@ def generate_packet():
         data = request.json
         packet_type = data.get('type', 'random')  # 'syn', 'ack', 'data', 'random'
         introduce_error = data.get('introduce_error', False)
-        
-        if packet_type == 'syn':
-            char = 'S'
-            flags = 1
-        elif packet_type == 'ack':
-            char = 'K'
-            flags = 2
-        elif packet_type == 'data':
-            char = random.choice(['X', 'Y', 'Z', 'A', 'B', 'C'])
-            flags = 0
-        else:  # random
-            char = random.choice(['S', 'K', 'X', 'Y', 'Z', 'A', 'B', 'C'])
-            flags = random.randint(0, 3)
-        
-        # Calculate checksum
-        if introduce_error:
-            checksum = ord(char) ^ 0xAA  # Wrong checksum
+
+        if packet_type in ('syn', 'ack'):
+            # Deterministic per (type, introduce_error); only the timestamp
+            # varies, so the tuple comes from the cache. Coerce to bool so
+            # arbitrary truthy values share one cache entry
+            char, checksum, flags = _fixed_packet(packet_type, bool(introduce_error))
         else:
-            checksum = ord(char) ^ 0xFF  # Correct checksum
-        
+            if packet_type == 'data':
+                char = _rng.choice(['X', 'Y', 'Z', 'A', 'B', 'C'])
+                flags = 0
+            else:  # random
+                char = _rng.choice(['S', 'K', 'X', 'Y', 'Z', 'A', 'B', 'C'])
+                flags = _rng.randint(0, 3)
+
+            # Calculate checksum
+            if introduce_error:
+                checksum = ord(char) ^ 0xAA  # Wrong checksum
+            else:
+                checksum = _CHECKSUM[ord(char)]  # Correct checksum
+
         packet = {
             'data': char,
             'checksum': checksum,